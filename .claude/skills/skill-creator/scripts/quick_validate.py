@@ -9,10 +9,93 @@ Examples:
     quick_validate.py skills/public/my-skill
 """
 
+import os
 import sys
 import re
 from pathlib import Path
 
+# Resolved paths cache. The resolved form is seeded as its own key, so
+# handing a result back in (as package_skill does when it passes the
+# resolved path to validate_skill) is a dict hit, not another resolve.
+_resolved_paths = {}
+
+
+def resolve_path(path_str):
+    """
+    Resolve a path string to an absolute Path, cached per process.
+
+    Path.resolve() walks every component on the filesystem, so callers
+    that validate and package the same skill should not pay for it
+    twice.
+    """
+    resolved = _resolved_paths.get(path_str)
+    if resolved is None:
+        resolved = Path(path_str).resolve()
+        _resolved_paths[path_str] = resolved
+        _resolved_paths[str(resolved)] = resolved
+    return resolved
+
+# Cache of parsed SKILL.md frontmatter keyed by file path, so packaging
+# and validation in the same process read and parse the file only once.
+# Entries are invalidated when the file's mtime changes.
+_frontmatter_cache = {}
+
+# Matches one "key: value" frontmatter line; a single multiline findall
+# replaces splitting and stripping every line in Python.
+_FRONTMATTER_FIELD_RE = re.compile(r'^[ \t]*([^:\n]+?)[ \t]*:[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+# Compiled once instead of per validation call
+_NAME_RE = re.compile(r'^[a-z0-9-]+$')
+
+# Fields allowed in SKILL.md frontmatter
+_ALLOWED_FIELDS = frozenset({'name', 'description', 'license', 'allowed-tools', 'metadata'})
+
+
+def load_frontmatter(skill_md):
+    """
+    Read a SKILL.md file and parse its YAML frontmatter.
+
+    Results are cached by mtime, so repeated calls for an unchanged
+    file (e.g. validate followed by package) do not re-read or
+    re-parse it.
+
+    Args:
+        skill_md: Path to the SKILL.md file
+
+    Returns:
+        Tuple of (content, metadata, error) - on failure content and
+        metadata are None and error describes what went wrong.
+    """
+    # Open once and fstat the descriptor - no separate exists()/stat()
+    # round trips before reading.
+    cache_key = str(skill_md)
+    try:
+        with open(skill_md, encoding='utf-8') as f:
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+            cached = _frontmatter_cache.get(cache_key)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            content = f.read()
+    except FileNotFoundError:
+        return None, None, "SKILL.md not found"
+    except Exception as e:
+        return None, None, f"Error reading SKILL.md: {e}"
+
+    if not content.startswith('---'):
+        result = (None, None, "SKILL.md must start with YAML frontmatter (---)")
+    else:
+        parts = content.split('---', 2)
+        if len(parts) < 3:
+            result = (None, None, "Invalid YAML frontmatter format (must have opening and closing ---)")
+        else:
+            # Parse frontmatter (basic parsing)
+            metadata = dict(_FRONTMATTER_FIELD_RE.findall(parts[1]))
+
+            result = (content, metadata, None)
+
+    _frontmatter_cache[cache_key] = (mtime, result)
+    return result
+
 
 def validate_skill(skill_path):
     """
@@ -24,66 +107,41 @@ def validate_skill(skill_path):
     Returns:
         True if valid, False if validation errors found
     """
-    skill_path = Path(skill_path).resolve()
+    skill_path = resolve_path(str(skill_path))
     errors = []
 
-    # Check if directory exists
-    if not skill_path.exists():
-        errors.append(f"Skill directory does not exist: {skill_path}")
-        return False
-
+    # Check if directory exists (one stat covers both checks)
     if not skill_path.is_dir():
-        errors.append(f"Path is not a directory: {skill_path}")
-        return False
-
-    # Check for SKILL.md
-    skill_md = skill_path / 'SKILL.md'
-    if not skill_md.exists():
-        errors.append("SKILL.md not found")
-        print_errors(errors)
-        return False
-
-    # Read SKILL.md content
-    try:
-        content = skill_md.read_text()
-    except Exception as e:
-        errors.append(f"Error reading SKILL.md: {e}")
-        print_errors(errors)
-        return False
-
-    # Check for YAML frontmatter
-    if not content.startswith('---'):
-        errors.append("SKILL.md must start with YAML frontmatter (---)")
+        if skill_path.exists():
+            errors.append(f"Path is not a directory: {skill_path}")
+        else:
+            errors.append(f"Skill directory does not exist: {skill_path}")
         print_errors(errors)
         return False
 
-    # Extract frontmatter
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        errors.append("Invalid YAML frontmatter format (must have opening and closing ---)")
+    # Read and parse SKILL.md frontmatter (cached by mtime); a missing
+    # file surfaces from the open itself, no exists() pre-check needed
+    skill_md = skill_path / 'SKILL.md'
+    content, metadata, parse_error = load_frontmatter(skill_md)
+    if parse_error:
+        errors.append(parse_error)
         print_errors(errors)
         return False
 
-    frontmatter = parts[1].strip()
-
-    # Parse frontmatter (basic parsing)
-    metadata = {}
-    for line in frontmatter.split('\n'):
-        line = line.strip()
-        if ':' in line:
-            key, value = line.split(':', 1)
-            metadata[key.strip()] = value.strip()
-
-    # Check required fields
+    # Check required fields, stopping at the first failing class of
+    # checks rather than running the remaining ones
     if 'name' not in metadata:
         errors.append("Missing required field 'name' in frontmatter")
     else:
         # Validate name format
         name = metadata['name']
-        if not re.match(r'^[a-z0-9-]+$', name):
+        if not _NAME_RE.match(name):
             errors.append(f"Invalid name format '{name}' - must be lowercase letters, digits, and hyphens only")
         if len(name) > 64:
             errors.append(f"Name too long ({len(name)} chars) - max 64 characters")
+    if errors:
+        print_errors(errors)
+        return False
 
     if 'description' not in metadata:
         errors.append("Missing required field 'description' in frontmatter")
@@ -95,20 +153,19 @@ def validate_skill(skill_path):
             errors.append(f"Description too long ({len(desc)} chars) - max 1024 characters")
         if '<' in desc or '>' in desc:
             errors.append("Description contains angle brackets - not allowed")
+    if errors:
+        print_errors(errors)
+        return False
 
     # Check for unexpected fields
-    allowed_fields = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
-    unexpected = set(metadata.keys()) - allowed_fields
+    unexpected = metadata.keys() - _ALLOWED_FIELDS
     if unexpected:
         errors.append(f"Unexpected fields in frontmatter: {', '.join(unexpected)}")
-
-    # Print results
-    if errors:
         print_errors(errors)
         return False
-    else:
-        print("✅ Skill validation passed")
-        return True
+
+    print("✅ Skill validation passed")
+    return True
 
 
 def print_errors(errors):
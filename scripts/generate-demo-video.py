@@ -27,35 +27,78 @@ POSTER_PATH = Path("website/static/img/screenshots/demo-poster.png")
 # Veo model - use 3.1 for best quality
 VEO_MODEL = "veo-3.1-generate-preview"
 
-# Demo video prompt
-DEMO_PROMPT = """Create a smooth, professional demo video showing an AI assistant workflow on a smartphone:
-
-SCENE 1 (0-2 seconds):
-A smartphone screen displaying a WhatsApp chat interface. The contact name shows "Ori 🐕" with a blue dot indicating online status. A user is typing a message that appears: "Hey Ori, schedule a meeting with Tom tomorrow at 3pm"
-
-SCENE 2 (2-4 seconds):
-The typing indicator shows Ori is responding. Then Ori's message appears with a friendly cartoon border collie avatar (blue bandana). The response shows: "I'll check Tom's availability..." followed by a small calendar preview card embedded in the chat showing tomorrow's schedule with available slots highlighted in green.
+# Chunk size for streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def get_field(obj, *names):
+    """
+    Return the first of names found on obj, reading dict keys and
+    attributes alike; None if absent.
+
+    The SDK returns plain dicts or typed objects depending on version,
+    with snake_case or camelCase field names - one lookup helper covers
+    all of it.
+    """
+    for name in names:
+        if isinstance(obj, dict):
+            if obj.get(name) is not None:
+                return obj[name]
+        else:
+            value = getattr(obj, name, None)
+            if value is not None:
+                return value
+    return None
+
+
+def stream_to_file(source, output_path):
+    """Copy a readable stream to disk in chunks, never buffering the whole video."""
+    with open(output_path, "wb") as f:
+        while True:
+            chunk = source.read(DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
+
+
+# Shared HTTP session so repeated download attempts reuse one
+# keep-alive connection (created lazily; requests is optional)
+_http_session = None
+
+
+def download_url_to_file(url, output_path):
+    """
+    Download a URL straight to disk with chunked writes.
+
+    Uses a shared requests session with connection keep-alive when the
+    package is available, falling back to urllib otherwise.
+    """
+    global _http_session
+    try:
+        import requests
+    except ImportError:
+        import urllib.request
+        with urllib.request.urlopen(url) as response:
+            stream_to_file(response, output_path)
+        return
 
-SCENE 3 (4-6 seconds):
-A new message from Ori appears: "Done! ✓ Meeting scheduled for tomorrow 3pm with Tom. Calendar invite sent to both of you." A small notification animation slides in from the top showing "📅 Meeting Scheduled - Tomorrow 3:00 PM".
+    if _http_session is None:
+        _http_session = requests.Session()
 
-SCENE 4 (6-8 seconds):
-The chat scrolls up slightly to show the full conversation. A subtle glow effect highlights the confirmation. The phone screen transitions to show a clean calendar view with the new meeting entry highlighted.
+    with _http_session.get(url, stream=True, timeout=300) as response:
+        response.raise_for_status()
+        with open(output_path, "wb") as f:
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
 
-VISUAL STYLE:
-- Clean, modern smartphone UI (iPhone-style bezels)
-- WhatsApp-like chat bubbles: green for user messages, white for Ori
-- Smooth, fluid animations between scenes
-- Soft, professional lighting on the phone
-- Cartoon mascot avatar for Ori (friendly blue border collie with bandana)
-- Neutral, blurred background suggesting a professional workspace
+# Demo video prompt lives in a sidecar file so the sizeable literal is
+# read only when generating, and is editable without touching code
+PROMPT_PATH = Path(__file__).with_name("demo-video-prompt.txt")
 
-AUDIO:
-- Subtle WhatsApp-like message send/receive sounds
-- Soft "ding" when meeting is confirmed
-- Light ambient background music (professional, optimistic tone)
 
-MOOD: Efficient, helpful, friendly. Demonstrate that complex tasks happen automatically through simple conversation."""
+def load_demo_prompt():
+    """Load the demo video prompt from its sidecar text file."""
+    return PROMPT_PATH.read_text(encoding="utf-8")
 
 
 def main():
@@ -91,27 +134,30 @@ def main():
     print("   This may take several minutes.")
     print()
 
+    reference_image = None
     try:
         # Initialize client
         client = genai.Client(api_key=api_key)
 
-        # Load reference image if available
-        reference_image = None
+        # Open reference image as a stream if available - the SDK can
+        # upload from a file object, so the image is never buffered
+        # whole in memory
         if POSTER_PATH.exists():
-            print(f"✅ Loading reference image from {POSTER_PATH}")
-            with open(POSTER_PATH, "rb") as f:
-                reference_image = f.read()
+            print(f"✅ Streaming reference image from {POSTER_PATH}")
+            reference_image = open(POSTER_PATH, "rb")
             print()
 
         print("📡 Calling Veo API...")
         print()
 
+        demo_prompt = load_demo_prompt()
+
         # Generate video
         # Try with generate_videos method
         try:
             operation = client.models.generate_videos(
                 model=VEO_MODEL,
-                prompt=DEMO_PROMPT,
+                prompt=demo_prompt,
                 config=types.GenerateVideosConfig(
                     aspect_ratio="16:9",
                     number_of_videos=1,
@@ -122,7 +168,7 @@ def main():
             print("ℹ️  Trying alternative API method...")
             operation = client.generate_video(
                 model=VEO_MODEL,
-                prompt=DEMO_PROMPT,
+                prompt=demo_prompt,
                 aspect_ratio="16:9",
             )
 
@@ -133,7 +179,10 @@ def main():
         print("⏳ Waiting for video generation to complete...")
         start_time = time.time()
         max_wait = 600  # 10 minutes
-        poll_interval = 5  # seconds
+        # Exponential backoff: poll quickly at first in case generation
+        # finishes fast, then back off to spare the API
+        poll_interval = 2  # seconds
+        max_poll_interval = 30  # seconds
 
         while not operation.done:
             elapsed = int(time.time() - start_time)
@@ -145,6 +194,7 @@ def main():
                 return 1
 
             time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, max_poll_interval)
 
             # Refresh operation status
             if hasattr(operation, 'name') and operation.name:
@@ -161,21 +211,16 @@ def main():
         print()
 
         # Check for errors
-        if hasattr(operation, 'error') and operation.error:
-            print(f"❌ Generation failed: {operation.error}")
+        error = get_field(operation, 'error')
+        if error:
+            print(f"❌ Generation failed: {error}")
             return 1
 
         # Get result
-        result = operation.result if hasattr(operation, 'result') else operation
+        result = get_field(operation, 'result') or operation
 
         # Find generated videos
-        generated_videos = None
-        if hasattr(result, 'generated_videos'):
-            generated_videos = result.generated_videos
-        elif hasattr(result, 'generatedVideos'):
-            generated_videos = result.generatedVideos
-        elif isinstance(result, dict):
-            generated_videos = result.get('generated_videos') or result.get('generatedVideos')
+        generated_videos = get_field(result, 'generated_videos', 'generatedVideos')
 
         if not generated_videos:
             print("❌ No video was generated")
@@ -191,59 +236,55 @@ def main():
 
         print("📥 Downloading video...")
 
-        # Try different ways to get the video data
+        # Try different ways to get the video data; URI and file-object
+        # sources stream to disk in chunks, only inline payloads pass
+        # through memory
         video_data = None
+        saved = False
 
         # Method 1: video has a .video file reference
-        if hasattr(video, 'video') and video.video:
+        video_ref = get_field(video, 'video')
+        if video_ref:
             try:
-                video_file = client.files.download(file=video.video)
+                video_file = client.files.download(file=video_ref)
                 if isinstance(video_file, bytes):
                     video_data = video_file
                 elif hasattr(video_file, 'read'):
-                    video_data = video_file.read()
-                elif hasattr(video_file, 'data'):
-                    video_data = video_file.data
+                    stream_to_file(video_file, output_path)
+                    saved = True
+                else:
+                    video_data = get_field(video_file, 'data')
             except Exception as e:
                 print(f"⚠️  Download method 1 failed: {e}")
 
-        # Method 2: video has URI
-        if not video_data and hasattr(video, 'uri') and video.uri:
-            try:
-                import urllib.request
-                with urllib.request.urlopen(video.uri) as response:
-                    video_data = response.read()
-            except Exception as e:
-                print(f"⚠️  Download method 2 failed: {e}")
-
-        # Method 3: video has inline data
-        if not video_data and hasattr(video, 'data'):
-            if isinstance(video.data, bytes):
-                video_data = video.data
-            elif isinstance(video.data, str):
-                video_data = base64.b64decode(video.data)
-
-        # Method 4: video is a dict with video_uri or data
-        if not video_data and isinstance(video, dict):
-            if 'video_uri' in video:
+        # Method 2: video has a URI
+        if not saved and not video_data:
+            uri = get_field(video, 'uri', 'video_uri')
+            if uri:
                 try:
-                    import urllib.request
-                    with urllib.request.urlopen(video['video_uri']) as response:
-                        video_data = response.read()
+                    download_url_to_file(uri, output_path)
+                    saved = True
                 except Exception as e:
-                    print(f"⚠️  Download method 4a failed: {e}")
-            elif 'data' in video:
-                video_data = base64.b64decode(video['data']) if isinstance(video['data'], str) else video['data']
+                    print(f"⚠️  Download method 2 failed: {e}")
 
-        if not video_data:
+        # Method 3: video has inline data (bytes or base64 string)
+        if not saved and not video_data:
+            inline = get_field(video, 'data')
+            if isinstance(inline, bytes):
+                video_data = inline
+            elif isinstance(inline, str):
+                video_data = base64.b64decode(inline)
+
+        if not saved and not video_data:
             print("❌ Could not extract video data")
             print(f"   Video object type: {type(video)}")
             print(f"   Video attributes: {dir(video) if hasattr(video, '__dir__') else video}")
             return 1
 
-        # Save video
-        with open(output_path, 'wb') as f:
-            f.write(video_data)
+        # Save inline payloads (streamed sources are already on disk)
+        if not saved:
+            with open(output_path, 'wb') as f:
+                f.write(video_data)
 
         file_size = output_path.stat().st_size / (1024 * 1024)
         print(f"✅ Video saved to: {output_path}")
@@ -274,6 +315,10 @@ def main():
         traceback.print_exc()
         return 1
 
+    finally:
+        if reference_image is not None:
+            reference_image.close()
+
 
 if __name__ == "__main__":
     exit(main())